@@ -1,7 +1,7 @@
 """
 Nautilus Trader - Communication Channel Module
 """
-from nautilus_channels.channel import Channel, ChannelConfig, ChannelType
+from nautilus_channels.channel import Channel, ChannelConfig, ChannelProto, ChannelType
 from nautilus_channels.telegram import TelegramChannelConfig, TelegramChannel
 
 # Whatsapp or Telegram Notifications
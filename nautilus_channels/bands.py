@@ -0,0 +1,23 @@
+"""
+Nautilus Trader - Trade Score Bands
+"""
+import bisect
+from typing import Any, Dict, Optional, Tuple
+
+
+def get_trade_band(trade_score: float, model: Dict[str, Any]) -> Tuple[int, Optional[Dict[str, Any]]]:
+    """Determines which band the score falls into.
+
+    The bands of each side must be sorted by ascending `edge`. Returns the index of the
+    first band whose edge is not below the score, or `(len(bands), None)` past the last one.
+    """
+    if trade_score > 0:
+        bands, edges_key = model.get("positive_bands", []), "_positive_edges"
+    else:
+        bands, edges_key = model.get("negative_bands", []), "_negative_edges"
+    # Cache the edges next to the bands they came from, so replaced bands are picked up
+    cached = model.get(edges_key)
+    if cached is None or cached[0] is not bands:
+        cached = model[edges_key] = (bands, [x.get("edge") for x in bands])
+    i = bisect.bisect_left(cached[1], trade_score)
+    return (i, bands[i]) if i < len(bands) else (len(bands), None)
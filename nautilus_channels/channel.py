@@ -3,13 +3,14 @@
 Nautilus Trader - Communication Channel Module
 """
 from __future__ import annotations
-from typing import Any, Optional, Dict
-from abc import ABC, abstractmethod
+from enum import StrEnum, unique
+from typing import Any, Optional, Dict, Protocol
 from nautilus_trader.core.data import Data
 from nautilus_trader.core.correctness import PyCondition
 from nautilus_trader.common.actor import Actor, ActorConfig
 
-class ChannelType:
+@unique
+class ChannelType(StrEnum):
     """
     Enum for different types of communication channels.
     """
@@ -46,18 +47,30 @@ class ChannelConfig(ActorConfig):
     channel_name: str
 
 
-class Channel(Actor, ABC):
+class ChannelProto(Protocol):
     """
-    Abstract base class for communication channels.
+    Static typing interface implemented by communication channels.
+    """
+
+    channel_name: str
+
+    async def send_notification(self, message: str, **kwargs: Dict[str, Any]) -> None: ...
+
+    async def handle_command(self, command: str, **kwargs: Dict[str, Any]) -> None: ...
+
+
+class Channel(Actor):
+    """
+    Base class for communication channels.
 
     This class provides a structure for sending notifications and receiving commands.
+    Subclasses must override `send_notification` and `handle_command`.
     """
 
     def __init__(self, config: ChannelConfig):
         super().__init__(config=config)
         self.channel_name = config.channel_name
 
-    @abstractmethod
     async def send_notification(self, message: str, **kwargs: Dict[str, Any]) -> None:
         """
         Sends a notification through the channel.
@@ -69,9 +82,8 @@ class Channel(Actor, ABC):
         kwargs : Dict[str, Any]
             Additional parameters for the notification.
         """
-        pass
+        raise NotImplementedError("method `send_notification` must be implemented in the subclass")
 
-    @abstractmethod
     async def handle_command(self, command: str, **kwargs: Dict[str, Any]) -> None:
         """
         Handles a command received through the channel.
@@ -83,7 +95,7 @@ class Channel(Actor, ABC):
         kwargs : Dict[str, Any]
             Additional parameters for the command.
         """
-        pass
+        raise NotImplementedError("method `handle_command` must be implemented in the subclass")
 
     def on_start(self) -> None:
         """
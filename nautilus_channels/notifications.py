@@ -0,0 +1,240 @@
+"""
+Nautilus Trader - Telegram Notifications Actor
+
+Work in progress: the actor still depends on helpers from the strategy project
+(`TelegramNotifier`, `TradeSignal`, `generate_chart`, ...), so it is not exported by the package.
+"""
+from __future__ import annotations
+import asyncio
+import io
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Final, Optional
+from aiogram.types import BufferedInputFile
+from nautilus_trader.common.actor import Actor
+from nautilus_trader.model.data import DataType
+from nautilus_trader.core.correctness import PyCondition
+from nautilus_channels.bands import get_trade_band
+
+_SYMBOL_CHARS: Final[Dict[str, str]] = {"BTCUSDT": "₿", "ETHUSDT": "Ξ"}
+_SCORE_COALESCE_SECS: Final[float] = 0.5
+_SCORE_QUEUE_SIZE: Final[int] = 64
+_MAX_PENDING_PHOTOS: Final[int] = 4
+_SCORE_TEMPLATE: Final[str] = "{sign} {symbol} {price:,} Score: {score:+.2f} {text}"
+_TX_TEMPLATE: Final[str] = "⚡💰 *{status}: Profit: {profit_percent:.2f}% {profit:.2f}₮*"
+
+
+class TelegramNotifications(Actor):
+    """Handles notifications related to trading scores and market activity.
+    
+    Notes:
+    ------
+        - Don't use Notifications in backtesting.
+    """
+    def __init__(self, config: NotificationsConfig):
+        PyCondition.non_empty(config.telegram_bot_token, "telegram_bot_token")
+        PyCondition.non_empty(config.telegram_chat_id, "telegram_chat_id")
+
+        super().__init__(config=config)
+        self.dataframe = dataframe
+        
+        self.telegram = TelegramNotifier(self.config.telegram_bot_token, parse_mode="markdown")
+        
+        # Hashes of recently sent score messages, used to drop replayed duplicates
+        self._recent_hashes: deque[int] = deque(maxlen=256)
+        self._recent_set: set[int] = set()
+        
+        # The symbol never changes, so bake it into the template and bind its format method once
+        symbol_char = _SYMBOL_CHARS.get(self.config["symbol"], self.config["symbol"])
+        self._format_score = _SCORE_TEMPLATE.replace("{symbol}", symbol_char).format
+        
+        # Chart rendering is CPU bound and must not stall the Telegram event loop.
+        # Created on start because a shut down executor cannot be restarted.
+        self._chart_executor: Optional[ThreadPoolExecutor] = None
+        # Bounds how many rendered charts can wait on Telegram at once
+        self._photo_sem = asyncio.BoundedSemaphore(_MAX_PENDING_PHOTOS)
+        
+        # Score messages are queued and sent by a coalescer task on the bot loop.
+        # The queue is bounded so a stalled sender pushes back on send_score, and
+        # it is only touched on the bot loop since asyncio queues are not thread-safe.
+        self._pending: asyncio.Queue[str] = asyncio.Queue(maxsize=_SCORE_QUEUE_SIZE)
+        self._coalescer: Optional[Future] = None
+    
+    def on_start(self):
+        """
+        Actions to be performed on notifications start.
+        """
+        self.telegram.run_background()
+        self._start_coalescer()
+        self._start_chart_executor()
+        
+        self.instrument = self.cache.instrument(self.config.instrument_id)
+        if self.instrument is None:
+            self.log.error(f"Could not find instrument for {self.config.instrument_id}")
+            self.stop()
+            return
+        
+        self.tick_size = self.instrument.price_increment
+        
+        # Subscribe to model and predictions
+        self.subscribe_data(data_type=DataType(TradeSignal, metadata={}))
+
+    def on_resume(self):
+        """
+        Actions to be performed on notifications resume.
+        """
+        self._start_coalescer()
+        self._start_chart_executor()
+
+    def on_stop(self):
+        """
+        Actions to be performed on notifications stop.
+        """
+        if self._coalescer is not None:
+            self._coalescer.cancel()
+            self._coalescer = None
+        if self._chart_executor is not None:
+            self._chart_executor.shutdown(wait=False, cancel_futures=True)
+            self._chart_executor = None
+
+    def _start_chart_executor(self) -> None:
+        """Creates the chart executor, a single worker because pyplot state is not thread-safe."""
+        if self._chart_executor is None:
+            self._chart_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chart")
+
+    async def _send_telegram_message(self, message: str, chat_id: Optional[int] = None):
+        """Helper function to send a Telegram message."""
+        chat_id = chat_id or self.config["telegram_chat_id"]
+        await self.telegram.send_message(chat_id=int(chat_id), text=message)
+
+    def _start_coalescer(self) -> None:
+        """Starts the score coalescer on the bot loop unless it is already running."""
+        if self._coalescer is None or self._coalescer.done():
+            self._coalescer = self.telegram.submit(self._coalesce_scores())
+
+    async def _coalesce_scores(self):
+        """Sends queued score messages, collapsing bursts into the latest one."""
+        try:
+            await self._drain_scores()
+        finally:
+            # Scores queued before a stop are stale by the time the actor resumes
+            while not self._pending.empty():
+                self._pending.get_nowait()
+
+    async def _drain_scores(self):
+        """Sends score messages from the queue until cancelled."""
+        while True:
+            message = await self._pending.get()
+            # Let a burst of band changes settle and only report where it ended up
+            await asyncio.sleep(_SCORE_COALESCE_SECS)
+            while not self._pending.empty():
+                message = self._pending.get_nowait()
+            if self._is_duplicate(message):
+                continue
+            try:
+                await self._send_telegram_message(message)
+            except Exception as e:
+                self.log.error(f"Failed to send score notification: {e}")
+            else:
+                # Only a delivered message may suppress identical ones later
+                self._remember_sent(message)
+
+    @handle_exceptions
+    async def send_score(self, model: Dict[str, Any]) -> None:
+        """Sends a Telegram notification when a trade score crosses a threshold."""
+        score_columns = model.get("score_column_names")
+        if not score_columns:
+            return
+
+        # Read scalars straight from the columns instead of materializing the last row as a Series
+        close_price = self.dataframe["close"].iat[-1]
+        trade_score_primary = self.dataframe[score_columns[0]].iat[-1]
+
+        band_no, band = get_trade_band(trade_score_primary, model)
+        if not band:
+            return
+
+        if not self._is_notification_needed(model, band_no, band):
+            return
+
+        message = self._format_score_message(close_price, trade_score_primary, band, model)
+        if self._is_duplicate(message):
+            return
+        # Enqueue on the bot loop, send_score may run on another loop or thread
+        await asyncio.wrap_future(self.telegram.submit(self._pending.put(message)))
+
+    def _is_notification_needed(self, model: Dict[str, Any], band_no: int, band: Dict[str, Any]) -> bool:
+        """Checks if a notification should be sent based on band movement."""
+        prev_band_no = model.get("prev_band_no")
+        model["prev_band_no"] = band_no
+        return prev_band_no is None or prev_band_no != band_no
+
+    def _is_duplicate(self, message: str) -> bool:
+        """Checks if the same message was sent recently."""
+        return hash(message) in self._recent_set
+
+    def _remember_sent(self, message: str) -> None:
+        """Records a sent message, forgetting the oldest one when the window is full."""
+        h = hash(message)
+        if h in self._recent_set:
+            return
+        if len(self._recent_hashes) == self._recent_hashes.maxlen:
+            self._recent_set.discard(self._recent_hashes[0])
+        self._recent_hashes.append(h)
+        self._recent_set.add(h)
+
+    def _format_score_message(self, close_price: float, trade_score: float, band: Dict[str, Any], model: Dict[str, Any]) -> str:
+        """Formats the trade score message."""
+        message = self._format_score(
+            sign=band.get("sign", ""), price=int(close_price), score=trade_score, text=band.get("text", "")
+        )
+        return f"*{message}*" if band.get("bold") else message
+
+    @handle_exceptions
+    async def send_diagram(self, model: Dict[str, Any]) -> None:
+        """Generates and sends a chart to Telegram."""
+        # Render inside the semaphore so no PNG is built before it can be sent
+        async with self._photo_sem:
+            loop = asyncio.get_running_loop()
+            png = await loop.run_in_executor(self._chart_executor, self._render_png, model)
+            photo = BufferedInputFile(png, filename="chart.png")
+            await self.telegram.send_photo(chat_id=int(self.config["telegram_chat_id"]), photo=photo)
+
+    def _render_png(self, model: Dict[str, Any]) -> bytes:
+        """Prepares the chart data and renders it to PNG bytes. Runs on the chart executor."""
+        # Imported here so the channel itself does not pay for matplotlib at import time
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from PIL import Image
+
+        df = self._prepare_chart_data(model)
+        fig = generate_chart(df, f"${self.config['symbol']}$", score_column=model.get("score_column_names"))
+        try:
+            canvas = FigureCanvasAgg(fig)
+            canvas.draw()
+            rgba = canvas.buffer_rgba()
+            image = Image.frombuffer("RGBA", (rgba.shape[1], rgba.shape[0]), rgba, "raw", "RGBA", 0, 1)
+            with io.BytesIO() as buf:
+                # Telegram recompresses photos, so favour encode speed over PNG size
+                image.save(buf, format="PNG", compress_level=1)
+                return buf.getvalue()
+        finally:
+            # Release the figure from pyplot's registry, a new one is built per chart
+            plt.close(fig)
+
+    def _prepare_chart_data(self, model: Dict[str, Any]) -> pd.DataFrame:
+        """Prepares chart data for visualization."""
+        required_columns = ["open", "high", "low", "close"] + model.get("score_column_names", [])
+        # Keep the requested column order, a set only speeds up the membership test
+        columns = set(self.dataframe.columns)
+        existing_columns = [c for c in required_columns if c in columns]
+        df = self.dataframe[existing_columns]
+        return resample_ohlc_data(df.reset_index(), model.get("resampling_freq"), model.get("nrows"))
+
+    @handle_exceptions
+    async def send_transaction_message(self, transaction: dict) -> None:
+        """Sends a notification for trade transactions."""
+        profit, profit_percent, *_ = await generate_transaction_stats() # generate_transaction_stats(self.state_machine.transaction)
+        status = transaction.get("status")
+        message = _TX_TEMPLATE.format(status=status, profit_percent=profit_percent, profit=profit)
+        await self._send_telegram_message(message)
@@ -1,14 +1,40 @@
 import asyncio
 import threading
-from typing import Optional
-from aiogram import Bot, Dispatcher, types
-from aiogram.types import Message
+import weakref
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Coroutine, Dict, Final, Optional
+from urllib.parse import urlsplit
+from aiogram import BaseMiddleware, Bot, Dispatcher, types
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.types import Message, TelegramObject
 from aiogram.filters import Command
 from aiogram.utils.markdown import hbold
-from nautilus_trader.model.data import DataType
+from aiogram.webhook.aiohttp_server import SimpleRequestHandler, setup_application
+from aiohttp import web
+from aiolimiter import AsyncLimiter
 from nautilus_trader.core.correctness import PyCondition
 from nautilus_channels.channel import ChannelConfig, Channel
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+def _new_event_loop() -> asyncio.AbstractEventLoop:
+    """Creates a new event loop, preferring uvloop when it is installed."""
+    if uvloop is not None:
+        return uvloop.new_event_loop()
+    return asyncio.new_event_loop()
+
+
+# Filters are stateless, so build them once and share them between channels
+_START_FILTER: Final[Command] = Command("start")
+
+# Idle per-chat rate limiters are evicted once this many chats have been seen
+_MAX_CHAT_LIMITERS: Final[int] = 1024
+
+
 class TelegramChannelConfig(ChannelConfig):    
     """
     Configuration for the Notifications actor.
@@ -21,12 +47,80 @@ class TelegramChannelConfig(ChannelConfig):
         The chat ID of the Telegram group or user to send notifications to.
     message_prefix : str, optional
         A prefix to prepend to all messages sent via Telegram (default is an empty string).
+    nonblocking_polling : bool, optional
+        Whether incoming updates are handled concurrently instead of one at a time (default is True).
+    max_concurrent_updates : int, optional
+        The maximum number of updates handled at once when non-blocking (default is 16).
+    rate_limit : float, optional
+        The maximum number of outgoing messages per second across all chats (default is 30).
+    chat_rate_limit : float, optional
+        The maximum number of outgoing messages per minute to a single chat (default is 20).
+    webhook_url : str, optional
+        The public HTTPS URL Telegram pushes updates to. Long polling is used when not set.
+    webhook_host : str, optional
+        The interface the webhook server binds to (default is "0.0.0.0").
+    webhook_port : int, optional
+        The port the webhook server listens on (default is 8443).
+    webhook_secret : str, optional
+        A secret Telegram sends with each update so the server can reject forged requests.
+        Required when `webhook_url` is set.
+    max_connections : int, optional
+        The maximum number of simultaneous webhook connections Telegram may open (default is 40).
     """
     token: str
     chat_id: str
     message_prefix: str = ""
     kwargs: dict = {}
-    
+    nonblocking_polling: bool = True
+    max_concurrent_updates: int = 16
+    rate_limit: float = 30
+    chat_rate_limit: float = 20
+    webhook_url: Optional[str] = None
+    webhook_host: str = "0.0.0.0"
+    webhook_port: int = 8443
+    webhook_secret: Optional[str] = None
+    max_connections: int = 40
+
+    def __post_init__(self):
+        # Runs once per config, both for configs built in code and decoded ones
+        PyCondition.valid_string(self.token, "token")
+        PyCondition.valid_string(self.chat_id, "chat_id")
+        # msgspec only type checks decoded configs, so check the fields used before any send
+        PyCondition.type(self.message_prefix, str, "message_prefix")
+        PyCondition.type(self.kwargs, dict, "kwargs")
+        if self.webhook_url is not None:
+            # The webhook server is publicly reachable, so updates must be authenticated
+            PyCondition.valid_string(self.webhook_secret, "webhook_secret")
+
+
+class ChatOrderingMiddleware(BaseMiddleware):
+    """
+    Bounds the number of concurrently running handlers while keeping updates
+    from the same chat in order.
+    """
+    def __init__(self, limit: int):
+        self._semaphore = asyncio.Semaphore(limit)
+        # Locks are dropped once no handler of that chat is pending
+        self._locks: weakref.WeakValueDictionary[int, asyncio.Lock] = weakref.WeakValueDictionary()
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any],
+    ) -> Any:
+        chat = getattr(event, "chat", None)
+        if chat is None:
+            async with self._semaphore:
+                return await handler(event, data)
+
+        lock = self._locks.get(chat.id)
+        if lock is None:
+            lock = self._locks[chat.id] = asyncio.Lock()
+        async with lock, self._semaphore:
+            return await handler(event, data)
+
+
 class TelegramChannel(Channel):
     """
     A class to manage communication with a Telegram bot using aiogram.
@@ -38,27 +132,69 @@ class TelegramChannel(Channel):
         Parameters:
             token (str): Telegram bot API token.
         """
-        PyCondition.type(config.token, str)
-        PyCondition.type(config.chat_id, str)
-        PyCondition.type(config.message_prefix, str)
-        PyCondition.type(config.kwargs, dict)
-        
         super().__init__(config)
         
-        self.bot = Bot(token=self.config.token, **self.config.kwargs)
+        # Share one keep-alive connection pool across sends and polling
+        kwargs = dict(self.config.kwargs)
+        self._session = kwargs.pop("session", None)
+        # Only close a session the channel created, a caller supplied one is theirs to manage
+        self._owns_session = self._session is None
+        if self._owns_session:
+            self._session = self._create_session()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._polling_task: Optional[asyncio.Task] = None
+        self._webhook_stop = asyncio.Event()
+        
+        # Stay below the Bot API flood limits instead of running into 429 errors
+        self._global_limiter = AsyncLimiter(self.config.rate_limit, 1)
+        self._chat_limiters: Dict[int, AsyncLimiter] = {}
+        
+        self.bot = Bot(token=self.config.token, session=self._session, **kwargs)
         self.dp = Dispatcher()
         
         # Register command handlers
-        self.dp.message.register(self.start_command, Command("start"))
+        self.dp.message.register(self.start_command, _START_FILTER)
         self.dp.message.register(self.echo_message)
+        
+        if self.config.nonblocking_polling:
+            self.dp.message.outer_middleware(ChatOrderingMiddleware(self.config.max_concurrent_updates))
+
+    @staticmethod
+    def _create_session() -> AiohttpSession:
+        """
+        Creates an HTTP session that keeps connections to the Bot API alive between calls.
+        """
+        session = AiohttpSession(limit=32)
+        # AiohttpSession builds its TCPConnector lazily from these private arguments.
+        # Only extend the keep-alive window, aiogram's own DNS cache TTL is kept as is.
+        connector_init = getattr(session, "_connector_init", None)
+        if isinstance(connector_init, dict):
+            connector_init["keepalive_timeout"] = 75
+        return session
+
+    def _chat_limiter(self, chat_id: int) -> AsyncLimiter:
+        """
+        Returns the rate limiter of a chat, evicting idle ones when too many chats are tracked.
+        """
+        limiter = self._chat_limiters.get(chat_id)
+        if limiter is None:
+            if len(self._chat_limiters) >= _MAX_CHAT_LIMITERS:
+                # A limiter with its full capacity available has not been used for a minute
+                self._chat_limiters = {
+                    cid: lim for cid, lim in self._chat_limiters.items() if not lim.has_capacity(lim.max_rate)
+                }
+            limiter = self._chat_limiters[chat_id] = AsyncLimiter(self.config.chat_rate_limit, 60)
+        return limiter
 
     async def start_command(self, message: Message):
         """Handles the /start command."""
-        await message.answer(f"Hello, {hbold(message.from_user.full_name)}! I am your trading bot.")
+        # Replies go through send_message so they count against the rate limits
+        await self.send_message(message.chat.id, f"Hello, {hbold(message.from_user.full_name)}! I am your trading bot.")
 
     async def echo_message(self, message: Message):
         """Echoes any received message."""
-        await message.answer(message.text)
+        await self.send_message(message.chat.id, message.text)
 
     async def send_message(self, chat_id: int, text: str, **kwargs):
         """
@@ -68,128 +204,190 @@ class TelegramChannel(Channel):
             chat_id (int): The chat ID to send the message to.
             text (str): The message content.
         """
-        await self.bot.send_message(chat_id, text, **kwargs)
+        # Wait for the chat first so a throttled chat does not hold bot-wide capacity
+        async with self._chat_limiter(chat_id), self._global_limiter:
+            await self.bot.send_message(chat_id, text, **kwargs)
+
+    async def send_notification(self, message: str, **kwargs: Dict[str, Any]) -> None:
+        """
+        Sends a notification to the configured chat, prepending the message prefix.
+        
+        Args:
+            message (str): The message content.
+        """
+        await self.send_message(int(self.config.chat_id), self.config.message_prefix + message, **kwargs)
+
+    async def handle_command(self, command: str, **kwargs: Dict[str, Any]) -> None:
+        """
+        Handles a command addressed to the bot, replying in the configured chat.
+        
+        Args:
+            command (str): The command to process, with or without the leading slash.
+        """
+        if command.lstrip("/") == "start":
+            await self.send_notification("Hello! I am your trading bot.", **kwargs)
+        else:
+            self.log.warning(f"Unknown command: {command}")
+
+    async def send_photo(self, chat_id: int, photo, **kwargs):
+        """
+        Sends a photo to a specific chat.
+        
+        Args:
+            chat_id (int): The chat ID to send the photo to.
+            photo (InputFile | str): The photo to send.
+        """
+        # Wait for the chat first so a throttled chat does not hold bot-wide capacity
+        async with self._chat_limiter(chat_id), self._global_limiter:
+            await self.bot.send_photo(chat_id, photo, **kwargs)
 
     def run(self):
         """
         Starts the bot and runs event loop.
         """
-        asyncio.run(self.dp.start_polling(self.bot))
+        with asyncio.Runner(loop_factory=_new_event_loop) as runner:
+            self._loop = runner.get_loop()
+            runner.run(self._serve())
         
     def run_background(self):
         """
         Starts the bot in a non-blocking background task.
         """
         try:
-            loop = asyncio.get_running_loop()
-            loop.create_task(self.dp.start_polling(self.bot))
+            self._loop = asyncio.get_running_loop()
+            # Keep a reference, the loop only holds weak references to its tasks
+            self._polling_task = self._loop.create_task(self._serve())
         except RuntimeError:
-            threading.Thread(target=lambda: asyncio.run(self.dp.start_polling(self.bot)), daemon=True).start()
+            # Keep a long-lived loop in a daemon thread that other threads can submit work to.
+            # The task is created before the loop runs, so no thread-safe handoff is needed.
+            self._loop = _new_event_loop()
+            # Signal handlers can only be installed from the main thread
+            self._polling_task = self._loop.create_task(self._serve(handle_signals=False))
+            self._thread = threading.Thread(target=self._run_loop, args=(self._loop,), name="telegram", daemon=True)
+            self._thread.start()
+        self._polling_task.add_done_callback(self._on_served)
 
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop):
+        """
+        Runs the channel-owned event loop until it is stopped, then closes it.
+        """
+        try:
+            loop.run_forever()
+            # Cancel whatever is still scheduled, mirroring asyncio.Runner.close
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            loop.close()
 
-# 
-# DUMP
-# 
+    def submit(self, coro: Coroutine[Any, Any, Any]) -> Future:
+        """
+        Schedules a coroutine on the bot's event loop from any thread.
+        
+        Args:
+            coro (Coroutine): The coroutine to run.
+        
+        Returns:
+            Future: A concurrent future holding the coroutine result.
+        """
+        PyCondition.not_none(self._loop, "loop")
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
 
+    async def _serve(self, **kwargs):
+        """
+        Receives updates through the webhook when configured, otherwise by long polling.
+        
+        Updates are dispatched as their own tasks when non-blocking. Extra keyword
+        arguments are passed on to `Dispatcher.start_polling`.
+        """
+        if self.config.webhook_url is None:
+            # Telegram rejects getUpdates while a webhook from an earlier run is still set
+            await self.bot.delete_webhook()
+            await self.dp.start_polling(
+                self.bot,
+                handle_as_tasks=self.config.nonblocking_polling,
+                close_bot_session=self._owns_session,
+                **kwargs,
+            )
+        else:
+            await self._serve_webhook()
 
+    async def _serve_webhook(self):
+        """
+        Runs an aiohttp server for Telegram to push updates to until the channel is closed.
+        """
+        # The event is set by close(), reset it so the channel can serve again after a restart
+        self._webhook_stop.clear()
 
+        app = web.Application()
+        handler = SimpleRequestHandler(
+            dispatcher=self.dp,
+            bot=self.bot,
+            handle_in_background=self.config.nonblocking_polling,
+            secret_token=self.config.webhook_secret,
+        )
+        # Add the route directly, register() would also close the bot session on shutdown.
+        # The session is closed by close(), and only when the channel owns it.
+        app.router.add_post(urlsplit(self.config.webhook_url).path or "/", handler.handle)
+        setup_application(app, self.dp, bot=self.bot)
 
-class TelegramNotifications(Actor):
-    """Handles notifications related to trading scores and market activity.
-    
-    Notes:
-    ------
-        - Don't use Notifications in backtesting.
-    """
-    def __init__(self, config: NotificationsConfig):
-        PyCondition.non_empty(config.telegram_bot_token, "telegram_bot_token")
-        PyCondition.non_empty(config.telegram_chat_id, "telegram_chat_id")
+        runner = web.AppRunner(app)
+        await runner.setup()
+        try:
+            await web.TCPSite(runner, self.config.webhook_host, self.config.webhook_port).start()
+            await self.bot.set_webhook(
+                self.config.webhook_url,
+                max_connections=self.config.max_connections,
+                allowed_updates=self.dp.resolve_used_update_types(),
+                secret_token=self.config.webhook_secret,
+            )
+            await self._webhook_stop.wait()
+        finally:
+            await runner.cleanup()
 
-        super().__init__(config=config)
-        self.dataframe = dataframe
-        
-        self.telegram = TelegramNotifier(self.config.telegram_bot_token, parse_mode="markdown")
-    
-    def on_start(self):
+    async def close(self):
         """
-        Actions to be performed on notifications start.
+        Stops receiving updates and closes the shared HTTP session if the channel created it.
         """
-        self.telegram.run_background()
-        
-        self.instrument = self.cache.instrument(self.config.instrument_id)
-        if self.instrument is None:
-            self.log.error(f"Could not find instrument for {self.config.instrument_id}")
-            self.stop()
-            return
-        
-        self.tick_size = self.instrument.price_increment
-        
-        # Subscribe to model and predictions
-        self.subscribe_data(data_type=DataType(TradeSignal, metadata={}))
-
-    async def _send_telegram_message(self, message: str, chat_id: Optional[int] = None):
-        """Helper function to send a Telegram message."""
-        chat_id = chat_id or self.config["telegram_chat_id"]
-        await self.telegram.send_message(chat_id=int(chat_id), text=message)
-
-    @handle_exceptions
-    async def send_score(self, model: Dict[str, Any]) -> None:
-        """Sends a Telegram notification when a trade score crosses a threshold."""
-        row = self.dataframe.iloc[-1]
-        close_price = row["close"]
-        trade_scores = [row[col] for col in model.get("score_column_names", [])]
-        trade_score_primary = trade_scores[0] if trade_scores else None
-        if trade_score_primary is None:
-            return
-
-        band_no, band = self._get_trade_band(trade_score_primary, model)
-        if not band:
-            return
-
-        if not self._is_notification_needed(model, band_no, band):
-            return
-
-        message = self._format_score_message(close_price, trade_score_primary, band, model)
-        await self._send_telegram_message(message)
-
-    def _get_trade_band(self, trade_score: float, model: Dict[str, Any]):
-        """Determines which band the score falls into."""
-        bands = model.get("positive_bands" if trade_score > 0 else "negative_bands", [])
-        return next(((i, x) for i, x in enumerate(bands) if trade_score <= x.get("edge")), (len(bands), None))
-
-    def _is_notification_needed(self, model: Dict[str, Any], band_no: int, band: Dict[str, Any]) -> bool:
-        """Checks if a notification should be sent based on band movement."""
-        prev_band_no = model.get("prev_band_no")
-        model["prev_band_no"] = band_no
-        return prev_band_no is None or prev_band_no != band_no
-
-    def _format_score_message(self, close_price: float, trade_score: float, band: Dict[str, Any], model: Dict[str, Any]) -> str:
-        """Formats the trade score message."""
-        symbol_char = {"BTCUSDT": "₿", "ETHUSDT": "Ξ"}.get(self.config["symbol"], self.config["symbol"])
-        message = f"{band.get('sign', '')} {symbol_char} {int(close_price):,} Score: {trade_score:+.2f} {band.get('text', '')}"
-        return f"*{message}*" if band.get("bold") else message
-
-    @handle_exceptions
-    async def send_diagram(self, model: Dict[str, Any]) -> None:
-        """Generates and sends a chart to Telegram."""
-        df = self._prepare_chart_data(model)
-        fig = generate_chart(df, f"${self.config['symbol']}$", score_column=model.get("score_column_names"))
-        with io.BytesIO() as buf:
-            fig.savefig(buf, format='png')
-            buf.seek(0)  # Move the cursor to the start of the file
-            await self.telegram.bot.send_photo(chat_id=int(self.config["telegram_chat_id"]), photo=buf)
-
-    def _prepare_chart_data(self, model: Dict[str, Any]) -> pd.DataFrame:
-        """Prepares chart data for visualization."""
-        required_columns = ["open", "high", "low", "close"] + model.get("score_column_names", [])
-        existing_columns = [col for col in required_columns if col in self.dataframe.columns]
-        df = self.dataframe[existing_columns]
-        return resample_ohlc_data(df.reset_index(), model.get("resampling_freq"), model.get("nrows"))
-
-    @handle_exceptions
-    async def send_transaction_message(self, transaction: dict) -> None:
-        """Sends a notification for trade transactions."""
-        profit, profit_percent, *_ = await generate_transaction_stats() # generate_transaction_stats(self.state_machine.transaction)
-        status = transaction.get("status")
-        message = f"⚡💰 *{status}: Profit: {profit_percent:.2f}% {profit:.2f}₮*"
-        await self._send_telegram_message(message)
+        if self.config.webhook_url is not None:
+            self._webhook_stop.set()
+        else:
+            try:
+                await self.dp.stop_polling()
+            except RuntimeError:
+                # Polling has not started yet, so there is nothing to wind down
+                if self._polling_task is not None:
+                    self._polling_task.cancel()
+        if self._polling_task is not None:
+            await asyncio.wait({self._polling_task})
+        if self._owns_session:
+            await self._session.close()
+
+    def on_stop(self) -> None:
+        """
+        Actions to perform when the channel stops.
+        """
+        loop = self._loop
+        if loop is not None and loop.is_running():
+            self.submit(self.close()).add_done_callback(self._on_closed)
+        super().on_stop()
+
+    def _on_served(self, task: asyncio.Task) -> None:
+        """
+        Reports errors that stopped the background polling or webhook task.
+        """
+        if not task.cancelled() and task.exception() is not None:
+            self.log.error(f"Error serving {self.channel_name} channel: {task.exception()!r}")
+
+    def _on_closed(self, future: Future) -> None:
+        """
+        Reports shutdown errors and stops the loop if the channel owns it.
+        """
+        if not future.cancelled() and future.exception() is not None:
+            self.log.error(f"Error closing {self.channel_name} channel: {future.exception()!r}")
+        if self._thread is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+
@@ -0,0 +1,42 @@
+import random
+
+import pytest
+
+from nautilus_channels.bands import get_trade_band
+
+
+def _linear_trade_band(trade_score, model):
+    # The lookup get_trade_band replaced, kept as the reference behaviour
+    bands = model.get("positive_bands" if trade_score > 0 else "negative_bands", [])
+    return next(((i, x) for i, x in enumerate(bands) if trade_score <= x.get("edge")), (len(bands), None))
+
+
+@pytest.fixture
+def model():
+    return {
+        "positive_bands": [{"edge": 0.1, "text": "p0"}, {"edge": 0.5, "text": "p1"}, {"edge": 0.9, "text": "p2"}],
+        "negative_bands": [{"edge": -0.9, "text": "n0"}, {"edge": -0.5, "text": "n1"}, {"edge": 0.0, "text": "n2"}],
+    }
+
+
+@pytest.mark.parametrize("score", [-1.0, -0.9, -0.7, -0.5, -0.1, 0.0, 0.05, 0.1, 0.3, 0.5, 0.9, 1.5])
+def test_matches_linear_scan_at_edges(model, score):
+    assert get_trade_band(score, model) == _linear_trade_band(score, model)
+
+
+def test_matches_linear_scan_on_random_scores(model):
+    rng = random.Random(0)
+    for _ in range(1000):
+        score = rng.uniform(-1.5, 1.5)
+        assert get_trade_band(score, model) == _linear_trade_band(score, model)
+
+
+def test_missing_side_has_no_band():
+    assert get_trade_band(0.5, {}) == (0, None)
+
+
+def test_replaced_bands_invalidate_cached_edges(model):
+    assert get_trade_band(0.3, model)[1]["text"] == "p1"
+    model["positive_bands"] = [{"edge": 0.2, "text": "q0"}, {"edge": 1.0, "text": "q1"}]
+    assert get_trade_band(0.3, model) == _linear_trade_band(0.3, model)
+    assert get_trade_band(0.3, model)[1]["text"] == "q1"
@@ -0,0 +1,114 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from nautilus_channels import telegram
+from nautilus_channels.telegram import ChatOrderingMiddleware, TelegramChannel, TelegramChannelConfig
+
+TOKEN = "123456:TEST-TOKEN"
+
+
+def _config(**kwargs):
+    return TelegramChannelConfig(channel_name="telegram", token=TOKEN, chat_id="1", **kwargs)
+
+
+def _event(chat_id):
+    return SimpleNamespace(chat=SimpleNamespace(id=chat_id))
+
+
+class TestConfig:
+    def test_defaults(self):
+        config = _config()
+        assert config.webhook_url is None
+        assert config.nonblocking_polling
+
+    @pytest.mark.parametrize("field", ["token", "chat_id"])
+    def test_rejects_empty_strings(self, field):
+        kwargs = {"channel_name": "telegram", "token": TOKEN, "chat_id": "1", field: ""}
+        with pytest.raises(ValueError):
+            TelegramChannelConfig(**kwargs)
+
+    @pytest.mark.parametrize("field, value", [("message_prefix", None), ("kwargs", [])])
+    def test_rejects_wrong_types(self, field, value):
+        with pytest.raises(TypeError):
+            _config(**{field: value})
+
+    def test_webhook_requires_secret(self):
+        with pytest.raises(TypeError):
+            _config(webhook_url="https://example.com/bot")
+        with pytest.raises(ValueError):
+            _config(webhook_url="https://example.com/bot", webhook_secret="")
+        assert _config(webhook_url="https://example.com/bot", webhook_secret="s3cret").webhook_secret == "s3cret"
+
+
+class TestChatOrderingMiddleware:
+    def test_keeps_updates_of_a_chat_in_order(self):
+        seen = []
+
+        async def handler(event, data):
+            # Later updates finish first unless the middleware serializes them
+            await asyncio.sleep(0.01 * (3 - data["n"]))
+            seen.append(data["n"])
+
+        async def main():
+            middleware = ChatOrderingMiddleware(limit=4)
+            await asyncio.gather(*(middleware(handler, _event(1), {"n": n}) for n in range(3)))
+
+        asyncio.run(main())
+        assert seen == [0, 1, 2]
+
+    def test_bounds_concurrent_handlers(self):
+        running = peak = 0
+
+        async def handler(event, data):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+
+        async def main():
+            middleware = ChatOrderingMiddleware(limit=2)
+            events = [_event(chat_id) for chat_id in range(6)] + [SimpleNamespace()]
+            await asyncio.gather(*(middleware(handler, event, {}) for event in events))
+            # Locks of chats without pending handlers are released
+            assert len(middleware._locks) == 0
+
+        asyncio.run(main())
+        assert peak == 2
+
+
+class TestChatLimiters:
+    @pytest.fixture
+    def channel(self):
+        return TelegramChannel(_config())
+
+    def test_reuses_limiter_of_a_chat(self, channel):
+        assert channel._chat_limiter(1) is channel._chat_limiter(1)
+
+    def test_evicts_idle_limiters_when_full(self, channel, monkeypatch):
+        monkeypatch.setattr(telegram, "_MAX_CHAT_LIMITERS", 4)
+
+        async def main():
+            # Limiters are only used from the bot loop
+            limiters = [channel._chat_limiter(chat_id) for chat_id in range(4)]
+            await limiters[1].acquire()
+            channel._chat_limiter(99)
+            return limiters
+
+        limiters = asyncio.run(main())
+        assert set(channel._chat_limiters) == {1, 99}
+        assert channel._chat_limiters[1] is limiters[1]
+
+    def test_handler_replies_are_rate_limited(self, channel, monkeypatch):
+        sent = []
+
+        async def send_message(chat_id, text, **kwargs):
+            sent.append((chat_id, text))
+
+        monkeypatch.setattr(channel.bot, "send_message", send_message)
+        message = SimpleNamespace(chat=SimpleNamespace(id=7), text="ping")
+        asyncio.run(channel.echo_message(message))
+        assert sent == [(7, "ping")]
+        assert 7 in channel._chat_limiters